@@ -0,0 +1,279 @@
+"""
+区域邻接关系模块
+
+在数据入库后计算同级行政区域之间的邻接图并存储为邻接表，
+提供基于内存图的邻居查询和最短跳数路径查询，查询时无需任何几何运算。
+"""
+
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import shapely
+from shapely import STRtree
+from geoalchemy2.shape import to_shape
+from models import DatabaseManager, AdministrativeArea, AreaAdjacency
+
+
+class AdjacencyBuilder:
+    """
+    邻接关系构建器
+
+    使用 STRtree 筛选候选区域对，再进行精确的相接判断，
+    按省份并行计算并写入 area_adjacency 表
+    """
+
+    # 邻接判断方式对应的 DE-9IM 模式：
+    # rook 要求内部不相交且边界共享长度大于 0 的线段；
+    # queen 只要求内部不相交且边界相交，仅有一个角点接触也视为相邻
+    CONTIGUITY_PATTERNS = {
+        'rook': 'F***1****',
+        'queen': 'F***T****',
+    }
+
+    def __init__(self, db_manager: DatabaseManager, max_workers: int = 4,
+                 contiguity: str = 'rook'):
+        """
+        初始化邻接关系构建器
+
+        Args:
+            db_manager: 数据库管理器实例
+            max_workers: 并行计算的线程数
+            contiguity: 邻接判断方式，rook（共享边界，默认）或 queen（共享边界或角点）
+
+        Raises:
+            ValueError: 当邻接判断方式不受支持时
+        """
+        if contiguity not in self.CONTIGUITY_PATTERNS:
+            raise ValueError(f"Unsupported contiguity: {contiguity}")
+        self.db_manager = db_manager
+        self.max_workers = max_workers
+        self.pattern = self.CONTIGUITY_PATTERNS[contiguity]
+
+    def build(self, levels: Optional[List[str]] = None) -> int:
+        """
+        计算并保存各层级的邻接关系
+
+        Args:
+            levels: 需要计算的行政级别列表，默认为库中已有的所有级别
+
+        Returns:
+            保存的相邻区域对数量
+        """
+        session = self.db_manager.get_session()
+        try:
+            if levels is None:
+                levels = [row[0] for row in session.query(AdministrativeArea.level).distinct()]
+
+            total = 0
+            for level in levels:
+                adcodes, provinces, geometries = self._load_level(session, level)
+                edges = self.compute_edges(provinces, geometries)
+
+                # 重建该层级的邻接记录，每对区域按两个方向各存储一条
+                session.query(AreaAdjacency).filter(AreaAdjacency.level == level).delete()
+                session.add_all(
+                    AreaAdjacency(level=level, adcode=adcodes[a], neighbor_adcode=adcodes[b])
+                    for i, j in edges
+                    for a, b in ((i, j), (j, i))
+                )
+                session.commit()
+                print(f"{level} 级共 {len(adcodes)} 个区域，{len(edges)} 对相邻关系")
+                total += len(edges)
+            return total
+        except Exception as e:
+            session.rollback()
+            print(f"计算邻接关系失败: {e}")
+            raise
+        finally:
+            session.close()
+
+    def compute_edges(self, provinces: List[str], geometries: List) -> Set[Tuple[int, int]]:
+        """
+        计算相邻区域对
+
+        Args:
+            provinces: 每个区域所属的省级编码，用于划分并行任务
+            geometries: 每个区域的 shapely 几何对象
+
+        Returns:
+            相邻区域的下标对集合 (i, j)，其中 i < j
+        """
+        tree = STRtree(geometries)
+
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for idx, province in enumerate(provinces):
+            groups[province].append(idx)
+
+        def _compute_group(indices: List[int]) -> List[Tuple[int, int]]:
+            """
+            计算一个省份内区域的邻接关系（包括与其他省份区域的跨省相邻）
+
+            Args:
+                indices: 该省份内区域的下标列表
+            """
+            # 使用外包矩形筛选候选区域对
+            query_idx, tree_idx = tree.query([geometries[i] for i in indices])
+            # 每对区域只由下标较小的一方计算一次
+            pairs = [
+                (indices[q], t)
+                for q, t in zip(query_idx.tolist(), tree_idx.tolist())
+                if indices[q] < t
+            ]
+            if not pairs:
+                return []
+            # 精确判断边界是否相接
+            adjacent = shapely.relate_pattern(
+                [geometries[i] for i, _ in pairs],
+                [geometries[j] for _, j in pairs],
+                self.pattern,
+            )
+            return [pair for pair, is_adjacent in zip(pairs, adjacent.tolist()) if is_adjacent]
+
+        edges = set()
+        # shapely 的向量化运算会释放 GIL，线程池即可实现并行
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for pairs in executor.map(_compute_group, groups.values()):
+                edges.update(pairs)
+        return edges
+
+    def _load_level(self, session, level: str) -> Tuple[List[str], List[str], List]:
+        """
+        加载指定层级的区域几何
+
+        Args:
+            session: 数据库会话
+            level: 行政级别
+
+        Returns:
+            (adcode 列表, 所属省级编码列表, 几何对象列表)
+        """
+        rows = session.query(
+            AdministrativeArea.adcode,
+            AdministrativeArea.raw_data,
+            AdministrativeArea.geometry,
+        ).filter(
+            AdministrativeArea.level == level,
+            AdministrativeArea.geometry.isnot(None),
+        ).all()
+
+        adcodes, provinces, geometries = [], [], []
+        for adcode, raw_data, geometry in rows:
+            acroutes = (raw_data or {}).get('acroutes', [])
+            adcodes.append(adcode)
+            provinces.append(self._province_of(adcode, acroutes))
+            geometries.append(to_shape(geometry))
+        return adcodes, provinces, geometries
+
+    @staticmethod
+    def _province_of(adcode: str, acroutes: List[int]) -> str:
+        """根据 acroutes 确定区域所属的省级编码，缺失时按编码前两位推断"""
+        if len(acroutes) > 1:
+            return str(acroutes[1])
+        return f"{str(adcode)[:2]}0000"
+
+
+class AdjacencyGraph:
+    """
+    区域邻接图
+
+    基于邻接表的内存图，邻居查询复杂度为 O(度)，支持广度优先的跳数查询
+    """
+
+    def __init__(self, edges: Iterable[Tuple[str, str]]):
+        """
+        初始化邻接图
+
+        Args:
+            edges: 相邻区域编码对，按无向边处理
+        """
+        self.adjacency: Dict[str, Set[str]] = defaultdict(set)
+        for adcode, neighbor_adcode in edges:
+            self.adjacency[adcode].add(neighbor_adcode)
+            self.adjacency[neighbor_adcode].add(adcode)
+
+    @classmethod
+    def from_database(cls, db_manager: DatabaseManager, level: Optional[str] = None) -> 'AdjacencyGraph':
+        """
+        从 area_adjacency 表加载邻接图
+
+        Args:
+            db_manager: 数据库管理器实例
+            level: 行政级别，默认加载所有级别
+
+        Returns:
+            AdjacencyGraph 对象
+        """
+        session = db_manager.get_session()
+        try:
+            query = session.query(AreaAdjacency.adcode, AreaAdjacency.neighbor_adcode)
+            if level:
+                query = query.filter(AreaAdjacency.level == level)
+            return cls(query.all())
+        finally:
+            session.close()
+
+    def neighbors(self, adcode: str) -> List[str]:
+        """
+        获取与指定区域相邻的区域
+
+        Args:
+            adcode: 行政区划编码
+
+        Returns:
+            相邻区域编码列表
+        """
+        return sorted(self.adjacency.get(adcode, ()))
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        广度优先搜索两个区域之间跳数最少的路径
+
+        Args:
+            source: 起始区域编码
+            target: 目标区域编码
+
+        Returns:
+            包含起止区域的编码列表，如果不连通则返回 None
+        """
+        if source not in self.adjacency or target not in self.adjacency:
+            return [source] if source == target else None
+
+        previous = {source: None}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = previous[current]
+                return path[::-1]
+            for neighbor in self.adjacency[current]:
+                if neighbor not in previous:
+                    previous[neighbor] = current
+                    queue.append(neighbor)
+        return None
+
+    def within_hops(self, adcode: str, max_hops: int) -> Dict[str, int]:
+        """
+        获取指定跳数范围内的所有区域
+
+        Args:
+            adcode: 起始区域编码
+            max_hops: 最大跳数
+
+        Returns:
+            区域编码到跳数的映射（不包含起始区域）
+        """
+        distances = {adcode: 0}
+        queue = deque([adcode])
+        while queue:
+            current = queue.popleft()
+            if distances[current] >= max_hops:
+                continue
+            for neighbor in self.adjacency.get(current, ()):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[current] + 1
+                    queue.append(neighbor)
+        del distances[adcode]
+        return distances
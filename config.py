@@ -31,6 +31,14 @@ class Config:
     MAX_LEVEL: int = int(os.getenv('MAX_LEVEL', '3'))         # 最大下钻层级
     DELAY_SECONDS: float = float(os.getenv('DELAY_SECONDS', '0.2'))  # 请求间隔时间
     
+    # 拓扑输出配置
+    TOPOLOGY_OUTPUT: str = os.getenv('TOPOLOGY_OUTPUT', '')  # 拓扑文件输出路径（为空则不输出）
+    TOPOLOGY_SCALE: float = float(os.getenv('TOPOLOGY_SCALE', '0.000001'))  # 坐标量化精度（度）
+    
+    # 邻接关系计算配置
+    ADJACENCY_WORKERS: int = int(os.getenv('ADJACENCY_WORKERS', '4'))  # 并行计算线程数
+    ADJACENCY_CONTIGUITY: str = os.getenv('ADJACENCY_CONTIGUITY', 'rook')  # 邻接判断方式（rook/queen）
+    
     @classmethod
     def get_database_url(cls) -> str:
         """
@@ -69,7 +69,7 @@ class DataProcessor:
             parent_name=parent_name,
             center=json.dumps(center) if center else None,
             children_num=children_num,
-            raw_data=json.dumps(feature, ensure_ascii=False)
+            raw_data=dict(properties)
         )
         
         # 如果存在几何数据，转换为 PostGIS 格式
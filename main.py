@@ -9,6 +9,8 @@ from data_fetcher import DataVFetcher
 from models import DatabaseManager
 from data_processor import DataProcessor
 from config import Config
+from topology import TopologyEncoder, save_topology
+from adjacency import AdjacencyBuilder
 
 
 def main():
@@ -19,8 +21,10 @@ def main():
     1. 验证配置
     2. 创建数据库表
     3. 获取行政区划数据
-    4. 逐级下钻处理数据
-    5. 保存到数据库
+    4. 输出拓扑文件（可选）
+    5. 逐级下钻处理数据
+    6. 保存到数据库
+    7. 计算区域邻接关系
     """
     
     # 验证配置是否有效
@@ -44,6 +48,8 @@ def main():
         # 创建数据库表
         print("\n创建数据库表...")
         db_manager.create_tables()
+        # 迁移旧版表结构中的 raw_data 列
+        db_manager.migrate_raw_data()
         
         # 开始获取数据
         print(f"\n开始从 {Config.START_ADCODE} 获取数据...")
@@ -54,6 +60,13 @@ def main():
         
         print(f"\n共获取到 {len(all_data)} 个区域的数据")
         
+        # 如果配置了拓扑输出路径，则将获取到的数据编码为共享弧段拓扑并写入文件
+        if Config.TOPOLOGY_OUTPUT:
+            print(f"\n生成拓扑文件: {Config.TOPOLOGY_OUTPUT}")
+            topology = TopologyEncoder(scale=Config.TOPOLOGY_SCALE).encode(all_data)
+            save_topology(topology, Config.TOPOLOGY_OUTPUT)
+            print(f"拓扑包含 {len(topology['arcs'])} 条弧段")
+        
         # 逐个处理获取到的数据
         total_saved = 0
         for idx, data in enumerate(all_data, 1):
@@ -75,6 +88,16 @@ def main():
         
         print(f"\n完成! 共保存 {total_saved} 条行政区划数据到数据库")
         
+        # 数据入库后计算各层级的区域邻接关系
+        print("\n计算区域邻接关系...")
+        builder = AdjacencyBuilder(
+            db_manager,
+            max_workers=Config.ADJACENCY_WORKERS,
+            contiguity=Config.ADJACENCY_CONTIGUITY,
+        )
+        total_edges = builder.build()
+        print(f"共保存 {total_edges} 对相邻区域")
+        
     except KeyboardInterrupt:
         print("\n用户中断操作")
     except Exception as e:
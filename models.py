@@ -4,11 +4,13 @@
 定义 SQLAlchemy ORM 模型类，用于映射到 PostgreSQL/PostGIS 数据库表
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Text
+from sqlalchemy import create_engine, Column, String, Integer, Index, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import sessionmaker
 from geoalchemy2 import Geometry
-from typing import Optional
+from typing import Any, List, Optional
 
 # 创建 SQLAlchemy 基类
 Base = declarative_base()
@@ -24,6 +26,16 @@ class AdministrativeArea(Base):
     # 表名
     __tablename__ = 'administrative_areas'
     
+    # raw_data 的 GIN 索引，使用 jsonb_path_ops 支持 @> 包含查询
+    __table_args__ = (
+        Index(
+            'ix_administrative_areas_raw_data',
+            'raw_data',
+            postgresql_using='gin',
+            postgresql_ops={'raw_data': 'jsonb_path_ops'},
+        ),
+    )
+    
     # 主键 ID，自增长
     id = Column(Integer, primary_key=True, autoincrement=True)
     
@@ -51,14 +63,125 @@ class AdministrativeArea(Base):
     # 子区域数量
     children_num = Column(Integer, default=0)
     
-    # 原始 JSON 数据，用于存储完整的 GeoJSON 特征数据
-    raw_data = Column(Text, nullable=True)
+    # 原始属性数据（JSONB 格式），仅存储 GeoJSON 特征的 properties，不含几何数据
+    raw_data = Column(JSONB, nullable=True)
+    
+    def get_property(self, key: str, default: Any = None) -> Any:
+        """
+        获取原始属性中的指定字段
+        
+        Args:
+            key: 属性名称
+            default: 属性不存在时的默认值
+            
+        Returns:
+            属性值
+        """
+        return (self.raw_data or {}).get(key, default)
+    
+    @hybrid_property
+    def acroutes(self) -> List[int]:
+        """从全国到上级区域的 adcode 路径"""
+        return self.get_property('acroutes', [])
+    
+    @acroutes.expression
+    def acroutes(cls):
+        """
+        SQL 表达式，返回 JSONB 数组
+        
+        该表达式无法利用 raw_data 的 GIN 索引，按祖先区域过滤请使用 under()
+        """
+        return cls.raw_data['acroutes']
+    
+    @hybrid_property
+    def centroid(self) -> Optional[List[float]]:
+        """区域质心坐标"""
+        return self.get_property('centroid')
+    
+    @centroid.expression
+    def centroid(cls):
+        """SQL 表达式，返回 JSONB 数组 [经度, 纬度]"""
+        return cls.raw_data['centroid']
+    
+    @hybrid_property
+    def sub_feature_index(self) -> Optional[int]:
+        """区域在上级数据中的序号"""
+        return self.get_property('subFeatureIndex')
+    
+    @sub_feature_index.expression
+    def sub_feature_index(cls):
+        """SQL 表达式，返回整数"""
+        return cls.raw_data['subFeatureIndex'].as_integer()
+    
+    @classmethod
+    def has_properties(cls, **properties):
+        """
+        构造属性包含查询条件（raw_data @> ...），可利用 GIN 索引
+        
+        Args:
+            properties: 需要匹配的属性，如 childrenNum=0
+            
+        Returns:
+            SQLAlchemy 查询条件
+        """
+        return cls.raw_data.contains(properties)
+    
+    @classmethod
+    def under(cls, ancestor_adcode: str):
+        """
+        构造祖先区域查询条件，匹配 acroutes 中包含指定 adcode 的所有下级区域
+        
+        Args:
+            ancestor_adcode: 祖先区域编码
+            
+        Returns:
+            SQLAlchemy 查询条件
+            
+        Raises:
+            ValueError: 当编码不是纯数字时（如 100000_JD），此类编码不会出现在 acroutes 中
+        """
+        if not str(ancestor_adcode).isdigit():
+            raise ValueError(f"Invalid ancestor adcode: {ancestor_adcode}")
+        return cls.raw_data.contains({'acroutes': [int(ancestor_adcode)]})
     
     def __repr__(self):
         """返回对象的字符串表示"""
         return f"<AdministrativeArea(adcode={self.adcode}, name={self.name}, level={self.level})>"
 
 
+class AreaAdjacency(Base):
+    """
+    区域邻接表模型
+    
+    映射到 area_adjacency 表，存储同级行政区域之间的相邻关系（边界相接），
+    每对相邻区域按两个方向各存储一条记录，便于按 adcode 直接查询邻居
+    """
+    
+    # 表名
+    __tablename__ = 'area_adjacency'
+    
+    # 同一对区域只存储一次（每个方向）
+    __table_args__ = (
+        UniqueConstraint('adcode', 'neighbor_adcode', name='uq_area_adjacency_pair'),
+    )
+    
+    # 主键 ID，自增长
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    
+    # 行政级别，用于按层级重建邻接关系，用于索引
+    level = Column(String(20), nullable=False, index=True)
+    
+    # 区域编码，用于索引
+    adcode = Column(String(20), nullable=False, index=True)
+    
+    # 相邻区域编码
+    neighbor_adcode = Column(String(20), nullable=False)
+    
+    def __repr__(self):
+        """返回对象的字符串表示"""
+        return f"<AreaAdjacency(adcode={self.adcode}, neighbor_adcode={self.neighbor_adcode})>"
+
+
 class DatabaseManager:
     """
     数据库管理器
@@ -82,6 +205,34 @@ class DatabaseManager:
         """创建数据库表"""
         Base.metadata.create_all(bind=self.engine)
     
+    def migrate_raw_data(self):
+        """
+        迁移已有表的 raw_data 列
+        
+        将旧版 Text 格式的完整 GeoJSON 特征转换为仅包含 properties 的 JSONB，
+        并创建 GIN 索引。可重复执行，已迁移的表不会被修改
+        """
+        with self.engine.begin() as conn:
+            data_type = conn.execute(text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_schema = current_schema() "
+                "AND table_name = 'administrative_areas' AND column_name = 'raw_data'"
+            )).scalar()
+            
+            # 列类型为 text 时，去除几何数据并转换为 JSONB（会重写整张表）
+            if data_type == 'text':
+                conn.execute(text(
+                    "ALTER TABLE administrative_areas ALTER COLUMN raw_data TYPE JSONB "
+                    "USING CASE WHEN raw_data IS NULL OR raw_data = '' THEN NULL "
+                    "ELSE raw_data::jsonb -> 'properties' END"
+                ))
+            
+            if data_type is not None:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_administrative_areas_raw_data "
+                    "ON administrative_areas USING gin (raw_data jsonb_path_ops)"
+                ))
+    
     def drop_tables(self):
         """删除数据库表"""
         Base.metadata.drop_all(bind=self.engine)
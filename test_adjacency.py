@@ -0,0 +1,44 @@
+"""
+区域邻接关系模块测试
+
+使用 3×3 网格验证邻接判断方式和广度优先查询
+"""
+
+import pytest
+from shapely.geometry import box
+from adjacency import AdjacencyBuilder, AdjacencyGraph
+
+# 3×3 网格，单元格编号按行排列：
+# 6 7 8
+# 3 4 5
+# 0 1 2
+GRID = [box(i % 3, i // 3, i % 3 + 1, i // 3 + 1) for i in range(9)]
+# 左侧三列属于省份 11，其余属于省份 12，用于覆盖跨省相邻
+PROVINCES = ['11' if i % 3 == 0 else '12' for i in range(9)]
+
+
+def _graph(contiguity):
+    edges = AdjacencyBuilder(None, contiguity=contiguity).compute_edges(PROVINCES, GRID)
+    return AdjacencyGraph((str(i), str(j)) for i, j in edges)
+
+
+def test_rook_ignores_corner_contacts():
+    graph = _graph('rook')
+    assert graph.neighbors('0') == ['1', '3']
+    assert graph.neighbors('4') == ['1', '3', '5', '7']
+    assert len(graph.shortest_path('0', '8')) == 5
+
+
+def test_queen_includes_corner_contacts():
+    graph = _graph('queen')
+    assert graph.neighbors('0') == ['1', '3', '4']
+    assert graph.shortest_path('0', '8') == ['0', '4', '8']
+
+
+def test_within_hops():
+    assert _graph('rook').within_hops('0', 2) == {'1': 1, '3': 1, '2': 2, '4': 2, '6': 2}
+
+
+def test_unsupported_contiguity():
+    with pytest.raises(ValueError):
+        AdjacencyBuilder(None, contiguity='bishop')
@@ -0,0 +1,69 @@
+"""
+数据库模型测试
+
+无需数据库连接，验证 raw_data 属性访问器和查询条件的编译结果
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from data_processor import DataProcessor
+from models import AdministrativeArea
+
+FEATURE = {
+    'type': 'Feature',
+    'properties': {
+        'adcode': 440305,
+        'name': '南山区',
+        'level': 'district',
+        'center': [113.929778, 22.531221],
+        'centroid': [113.923926, 22.515395],
+        'childrenNum': 0,
+        'subFeatureIndex': 1,
+        'acroutes': [100000, 440000, 440300],
+        'parent': {'adcode': 440300},
+    },
+    'geometry': {
+        'type': 'MultiPolygon',
+        'coordinates': [[[[113.9, 22.5], [114.0, 22.5], [114.0, 22.6], [113.9, 22.5]]]],
+    },
+}
+
+
+def _compile(clause):
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_property_filters_use_containment():
+    # GIN 索引（jsonb_path_ops）只能用于 raw_data 列上的 @> 查询
+    assert _compile(AdministrativeArea.under('440000')) == \
+        'administrative_areas.raw_data @> %(raw_data_1)s::JSONB'
+    assert _compile(AdministrativeArea.has_properties(childrenNum=0)) == \
+        'administrative_areas.raw_data @> %(raw_data_1)s::JSONB'
+
+
+def test_under_rejects_non_numeric_adcode():
+    with pytest.raises(ValueError):
+        AdministrativeArea.under('100000_JD')
+
+
+def test_accessors_read_properties():
+    area = AdministrativeArea(raw_data=FEATURE['properties'])
+    assert area.acroutes == [100000, 440000, 440300]
+    assert area.centroid == [113.923926, 22.515395]
+    assert area.sub_feature_index == 1
+    assert area.get_property('childrenNum') == 0
+
+
+def test_accessors_without_raw_data():
+    area = AdministrativeArea(raw_data=None)
+    assert area.acroutes == []
+    assert area.centroid is None
+    assert area.sub_feature_index is None
+    assert area.get_property('childrenNum', 0) == 0
+
+
+def test_parsed_raw_data_excludes_geometry():
+    area = DataProcessor(None).parse_geojson_feature(FEATURE)
+    assert area.raw_data == FEATURE['properties']
+    assert 'geometry' not in area.raw_data
+    assert area.geometry is not None
@@ -0,0 +1,90 @@
+"""
+拓扑编码模块测试
+
+覆盖带内环的区域、相邻区域以及填充内环的飞地的还原与简化
+"""
+
+from shapely.geometry import Polygon, shape
+from topology import TopologyEncoder, TopologyDecoder, simplify_topology
+
+# 区域 A：带内环的正方形，西侧边界上有一个略微偏移的顶点
+AREA_A = [
+    [[116.0, 39.0], [116.5, 39.0], [116.502, 39.25], [116.5, 39.5], [116.0, 39.5], [116.001, 39.25],
+     [116.0, 39.0]],
+    [[116.1, 39.1], [116.2, 39.1], [116.2, 39.2], [116.1, 39.1]],
+]
+# 区域 B：与 A 共享东侧边界（含一个略微偏移的顶点）
+AREA_B = [
+    [[116.5, 39.0], [117.0, 39.0], [117.0, 39.5], [116.5, 39.5], [116.502, 39.25], [116.5, 39.0]],
+]
+# 区域 C：恰好填满 A 的内环的飞地
+AREA_C = [
+    [[116.1, 39.1], [116.2, 39.2], [116.2, 39.1], [116.1, 39.1]],
+]
+
+
+def _feature(adcode, coordinates):
+    return {
+        'type': 'Feature',
+        'properties': {'adcode': adcode, 'name': str(adcode), 'level': 'district'},
+        'geometry': {'type': 'Polygon', 'coordinates': coordinates},
+    }
+
+
+def _topology():
+    return TopologyEncoder().encode({
+        'type': 'FeatureCollection',
+        'features': [_feature(1, AREA_A), _feature(2, AREA_B), _feature(3, AREA_C)],
+    })
+
+
+def test_round_trip_is_exact():
+    decoder = TopologyDecoder(_topology())
+    for adcode, coordinates in ((1, AREA_A), (2, AREA_B), (3, AREA_C)):
+        expected = shape({'type': 'Polygon', 'coordinates': coordinates})
+        assert decoder.decode_geometry(adcode).equals(expected)
+
+
+def test_shared_rings_are_stored_once():
+    # A/B 公共边、A 外环其余部分、B 外环其余部分、A 内环与 C 共用的环
+    assert len(_topology()['arcs']) == 4
+
+
+def _point_count(topology):
+    return sum(len(arc) for arc in topology['arcs'])
+
+
+def test_simplify_removes_small_deviations():
+    topology = _topology()
+    simplified = simplify_topology(topology, 0.01)
+    assert _point_count(simplified) < _point_count(topology)
+
+    decoder = TopologyDecoder(simplified)
+    area_a = decoder.decode_geometry(1)
+    area_b = decoder.decode_geometry(2)
+    area_c = decoder.decode_geometry(3)
+
+    assert area_a.is_valid and area_b.is_valid and area_c.is_valid
+    assert len(area_a.geoms) == 1 and len(area_a.geoms[0].interiors) == 1
+    assert area_a.equals(shape({'type': 'Polygon', 'coordinates': [
+        [[116.0, 39.0], [116.5, 39.0], [116.5, 39.5], [116.0, 39.5], [116.0, 39.0]],
+        AREA_A[1],
+    ]}))
+    # 公共边界简化结果一致，相邻区域之间没有缝隙或重叠
+    assert area_a.intersection(area_b).area == 0
+    assert area_a.union(area_b).union(area_c).area == 0.5
+    # 飞地仍然恰好填满 A 的内环
+    assert area_c.equals(shape({'type': 'Polygon', 'coordinates': AREA_C}))
+
+
+def test_simplify_never_emits_invalid_polygons():
+    # 容差过大时简化会使内环落到外环之外，此时应恢复相关弧段
+    decoder = TopologyDecoder(simplify_topology(_topology(), 10))
+    area_a = decoder.decode_geometry(1)
+    area_b = decoder.decode_geometry(2)
+    area_c = decoder.decode_geometry(3)
+
+    assert area_a.is_valid and area_b.is_valid and area_c.is_valid
+    assert not area_b.is_empty
+    assert len(area_a.geoms) == 1 and len(area_a.geoms[0].interiors) == 1
+    assert Polygon(area_a.geoms[0].exterior).contains(area_c)
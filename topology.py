@@ -0,0 +1,455 @@
+"""
+拓扑编码模块
+
+将行政区划 GeoJSON 数据编码为共享弧段的拓扑结构（TopoJSON 风格），
+相邻区域的公共边界只存储一次，坐标量化为整数并进行差分编码，
+同时支持按 adcode 还原 MULTIPOLYGON 几何以及沿公共边一致的简化。
+"""
+
+import json
+import math
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from shapely.geometry import LineString, MultiPolygon, Polygon
+
+# 量化后的坐标点类型
+Point = Tuple[int, int]
+
+# 默认量化精度（度），与 DataV 数据的 6 位小数精度一致，可无损还原
+DEFAULT_SCALE = 1e-6
+
+
+class TopologyEncoder:
+    """
+    拓扑编码器
+
+    从 GeoJSON 特征中提取共享弧段，生成 TopoJSON 风格的拓扑数据
+    """
+
+    def __init__(self, scale: float = DEFAULT_SCALE):
+        """
+        初始化拓扑编码器
+
+        Args:
+            scale: 坐标量化精度（度），即整数坐标的一个单位对应的经纬度差
+        """
+        self.scale = scale
+
+    def encode(self, data: Union[Dict, Iterable[Dict]]) -> Dict:
+        """
+        将一个层级或一棵子树的 GeoJSON 数据编码为拓扑结构
+
+        Args:
+            data: 单个 FeatureCollection，或 drill_down 返回的 FeatureCollection 列表
+
+        Returns:
+            TopoJSON 风格的拓扑字典，按行政级别划分 objects
+        """
+        features = self._collect_features(data)
+
+        # 计算平移量，使量化后的整数坐标从 0 开始
+        min_x, min_y = self._bounds_origin(features)
+        translate = [
+            math.floor(min_x / self.scale) * self.scale,
+            math.floor(min_y / self.scale) * self.scale,
+        ]
+
+        # 量化所有多边形的环
+        quantized = []
+        for feature in features:
+            polygons = []
+            for polygon in self._polygon_coordinates(feature['geometry']):
+                rings = [self._quantize_ring(ring, translate) for ring in polygon]
+                # 外环退化时整个多边形无效，不能让内环顶替外环
+                if len(rings[0]) < 4:
+                    continue
+                polygons.append([rings[0]] + [ring for ring in rings[1:] if len(ring) >= 4])
+            quantized.append(polygons)
+
+        # 查找交汇点并切分弧段
+        junctions = self._find_junctions(
+            ring for polygons in quantized for polygon in polygons for ring in polygon
+        )
+        arcs: List[List[Point]] = []
+        arc_index: Dict[Tuple[Point, ...], int] = {}
+
+        objects: Dict[str, Dict] = {}
+        for feature, polygons in zip(features, quantized):
+            arc_refs = [
+                [self._ring_arcs(ring, junctions, arcs, arc_index) for ring in polygon]
+                for polygon in polygons
+            ]
+            properties = feature.get('properties', {})
+            level = properties.get('level') or 'unknown'
+            collection = objects.setdefault(level, {'type': 'GeometryCollection', 'geometries': []})
+            collection['geometries'].append({
+                'type': 'MultiPolygon',
+                'id': str(properties.get('adcode')),
+                'properties': properties,
+                'arcs': arc_refs,
+            })
+
+        return {
+            'type': 'Topology',
+            'transform': {'scale': [self.scale, self.scale], 'translate': translate},
+            'objects': objects,
+            'arcs': [_delta_encode(arc) for arc in arcs],
+        }
+
+    def _collect_features(self, data: Union[Dict, Iterable[Dict]]) -> List[Dict]:
+        """
+        收集带有多边形几何的特征，按 adcode 去重
+
+        Args:
+            data: 单个 FeatureCollection 或 FeatureCollection 列表
+
+        Returns:
+            特征列表
+        """
+        collections = [data] if isinstance(data, dict) else list(data)
+        features = {}
+        for collection in collections:
+            for feature in collection.get('features', []):
+                geometry = feature.get('geometry')
+                adcode = feature.get('properties', {}).get('adcode')
+                if not adcode or not geometry:
+                    continue
+                if geometry.get('type') not in ('Polygon', 'MultiPolygon'):
+                    continue
+                features.setdefault(str(adcode), feature)
+        return list(features.values())
+
+    def _polygon_coordinates(self, geometry: Dict) -> List[List[List[List[float]]]]:
+        """将 Polygon / MultiPolygon 统一为多边形坐标列表"""
+        if geometry['type'] == 'Polygon':
+            return [geometry['coordinates']]
+        return geometry['coordinates']
+
+    def _bounds_origin(self, features: List[Dict]) -> Tuple[float, float]:
+        """计算所有坐标的最小经纬度"""
+        min_x = min_y = math.inf
+        for feature in features:
+            for polygon in self._polygon_coordinates(feature['geometry']):
+                for ring in polygon:
+                    for x, y in (point[:2] for point in ring):
+                        min_x = min(min_x, x)
+                        min_y = min(min_y, y)
+        if min_x == math.inf:
+            return 0.0, 0.0
+        return min_x, min_y
+
+    def _quantize_ring(self, ring: List[List[float]], translate: List[float]) -> List[Point]:
+        """
+        将环的坐标量化为整数，并去除连续重复点
+
+        Args:
+            ring: 原始坐标环
+            translate: 平移量
+
+        Returns:
+            闭合的量化坐标环
+        """
+        points: List[Point] = []
+        for coord in ring:
+            point = (
+                round((coord[0] - translate[0]) / self.scale),
+                round((coord[1] - translate[1]) / self.scale),
+            )
+            if not points or points[-1] != point:
+                points.append(point)
+        if points and points[0] != points[-1]:
+            points.append(points[0])
+        return points
+
+    def _find_junctions(self, rings: Iterable[List[Point]]) -> set:
+        """
+        查找交汇点
+
+        同一坐标点在不同位置出现且相邻点不同，说明边界在此处分叉，
+        该点即为弧段的切分点
+
+        Args:
+            rings: 所有量化后的坐标环
+
+        Returns:
+            交汇点集合
+        """
+        neighbors: Dict[Point, frozenset] = {}
+        junctions = set()
+        for ring in rings:
+            count = len(ring) - 1
+            for i in range(count):
+                point = ring[i]
+                adjacent = frozenset((ring[i - 1] if i else ring[count - 1], ring[i + 1]))
+                seen = neighbors.get(point)
+                if seen is None:
+                    neighbors[point] = adjacent
+                elif seen != adjacent:
+                    junctions.add(point)
+        return junctions
+
+    def _ring_arcs(self, ring: List[Point], junctions: set, arcs: List[List[Point]],
+                   arc_index: Dict[Tuple[Point, ...], int]) -> List[int]:
+        """
+        将环切分为弧段并返回弧段引用
+
+        Args:
+            ring: 量化后的闭合坐标环
+            junctions: 交汇点集合
+            arcs: 全局弧段列表（会被追加）
+            arc_index: 弧段坐标到索引的映射（会被追加）
+
+        Returns:
+            弧段引用列表，负数 ~i 表示反向使用第 i 条弧段
+        """
+        points = ring[:-1]
+        cuts = [i for i, point in enumerate(points) if point in junctions]
+
+        if not cuts:
+            # 无交汇点的环整体作为一条弧段，旋转到最小点起始以便识别相同的环
+            start = points.index(min(points))
+            rotated = points[start:] + points[:start]
+            return [self._arc_ref(rotated + [rotated[0]], arcs, arc_index)]
+
+        # 从第一个交汇点开始，在每个交汇点处切分
+        rotated = points[cuts[0]:] + points[:cuts[0]] + [points[cuts[0]]]
+        refs = []
+        current = [rotated[0]]
+        for point in rotated[1:]:
+            current.append(point)
+            if point in junctions:
+                refs.append(self._arc_ref(current, arcs, arc_index))
+                current = [point]
+        return refs
+
+    def _arc_ref(self, arc: List[Point], arcs: List[List[Point]],
+                 arc_index: Dict[Tuple[Point, ...], int]) -> int:
+        """查找或登记弧段，返回其引用（正向为 i，反向为 ~i）"""
+        key = tuple(arc)
+        if key in arc_index:
+            return arc_index[key]
+        reverse_key = key[::-1]
+        if reverse_key in arc_index:
+            return ~arc_index[reverse_key]
+        arc_index[key] = len(arcs)
+        arcs.append(arc)
+        return arc_index[key]
+
+
+class TopologyDecoder:
+    """
+    拓扑解码器
+
+    从拓扑数据中还原指定行政区域的 MULTIPOLYGON 几何
+    """
+
+    def __init__(self, topology: Dict):
+        """
+        初始化拓扑解码器
+
+        Args:
+            topology: TopologyEncoder 生成的拓扑字典
+        """
+        self.topology = topology
+        transform = topology.get('transform')
+        self.scale = transform['scale'] if transform else [1, 1]
+        self.translate = transform['translate'] if transform else [0, 0]
+        # 根据量化精度确定还原时保留的小数位数，消除浮点误差
+        self.ndigits = max(0, math.ceil(-math.log10(min(self.scale))))
+        self.arcs = [self._decode_arc(arc) for arc in topology.get('arcs', [])]
+        self.geometries = {
+            geometry['id']: geometry
+            for collection in topology.get('objects', {}).values()
+            for geometry in collection.get('geometries', [])
+        }
+
+    def adcodes(self) -> List[str]:
+        """
+        获取拓扑中包含的所有区域编码
+
+        Returns:
+            adcode 列表
+        """
+        return list(self.geometries.keys())
+
+    def properties(self, adcode: str) -> Optional[Dict]:
+        """
+        获取指定区域的属性
+
+        Args:
+            adcode: 行政区划编码
+
+        Returns:
+            属性字典，如果不存在则返回 None
+        """
+        geometry = self.geometries.get(str(adcode))
+        return geometry.get('properties') if geometry else None
+
+    def decode_geometry(self, adcode: str) -> Optional[MultiPolygon]:
+        """
+        还原指定区域的几何
+
+        Args:
+            adcode: 行政区划编码
+
+        Returns:
+            MultiPolygon 对象，如果不存在则返回 None
+        """
+        geometry = self.geometries.get(str(adcode))
+        if not geometry:
+            return None
+
+        polygons = []
+        for polygon in geometry['arcs']:
+            rings = [self._stitch_ring(refs) for refs in polygon]
+            # 外环退化时丢弃整个多边形，内环退化时只丢弃该内环
+            if len(rings[0]) < 4:
+                continue
+            polygons.append(Polygon(rings[0], [ring for ring in rings[1:] if len(ring) >= 4]))
+        return MultiPolygon(polygons)
+
+    def to_geojson_feature(self, adcode: str) -> Optional[Dict]:
+        """
+        还原指定区域的 GeoJSON 特征，可直接交给 DataProcessor 解析入库
+
+        Args:
+            adcode: 行政区划编码
+
+        Returns:
+            GeoJSON 特征字典，如果不存在则返回 None
+        """
+        geometry = self.decode_geometry(adcode)
+        if geometry is None:
+            return None
+        return {
+            'type': 'Feature',
+            'properties': self.properties(adcode),
+            'geometry': geometry.__geo_interface__,
+        }
+
+    def _decode_arc(self, arc: List[List[int]]) -> List[Tuple[float, float]]:
+        """将差分编码的弧段还原为经纬度坐标"""
+        return [
+            (
+                round(x * self.scale[0] + self.translate[0], self.ndigits),
+                round(y * self.scale[1] + self.translate[1], self.ndigits),
+            )
+            for x, y in _delta_decode(arc)
+        ]
+
+    def _stitch_ring(self, refs: List[int]) -> List[Tuple[float, float]]:
+        """按弧段引用拼接坐标环"""
+        return _stitch_ring(refs, self.arcs)
+
+
+def _delta_encode(arc: List[Point]) -> List[List[int]]:
+    """对弧段坐标进行差分编码"""
+    encoded = [list(arc[0])]
+    for (x0, y0), (x1, y1) in zip(arc, arc[1:]):
+        encoded.append([x1 - x0, y1 - y0])
+    return encoded
+
+
+def _delta_decode(arc: List[List[int]]) -> List[Point]:
+    """将差分编码的弧段还原为量化坐标"""
+    points = []
+    x = y = 0
+    for dx, dy in arc:
+        x += dx
+        y += dy
+        points.append((x, y))
+    return points
+
+
+def _stitch_ring(refs: List[int], arcs: List[List]) -> List:
+    """按弧段引用拼接坐标环，相邻弧段的公共端点只保留一次"""
+    ring = []
+    for ref in refs:
+        arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+        ring.extend(arc[1:] if ring else arc)
+    return ring
+
+
+def _polygon_is_valid(polygon: List[List[int]], arcs: List[List[Point]]) -> bool:
+    """判断由弧段引用组成的多边形是否有效（外环不退化，内环位于外环之内等）"""
+    rings = [_stitch_ring(refs, arcs) for refs in polygon]
+    if any(len(ring) < 4 for ring in rings):
+        return False
+    return Polygon(rings[0], rings[1:]).is_valid
+
+
+def simplify_topology(topology: Dict, tolerance: float) -> Dict:
+    """
+    沿弧段简化拓扑
+
+    每条弧段只简化一次且保留端点，因此相邻区域的公共边界简化结果一致，
+    不会产生缝隙或重叠。简化后无效的多边形（如外环退化、内环落到外环之外）
+    会将其用到的弧段恢复为原始坐标，直到所有多边形都有效为止
+
+    Args:
+        topology: TopologyEncoder 生成的拓扑字典
+        tolerance: 简化容差（度）
+
+    Returns:
+        简化后的新拓扑字典
+    """
+    scale = topology['transform']['scale']
+    # 容差换算为量化后的整数单位
+    tolerance_units = tolerance / min(scale)
+
+    original_arcs = [_delta_decode(arc) for arc in topology['arcs']]
+    simplified_arcs = []
+    for points in original_arcs:
+        if len(points) > 2:
+            simplified = list(LineString(points).simplify(tolerance_units, preserve_topology=False).coords)
+            # 闭合弧段简化后至少保留 4 个点，否则保持原样
+            if points[0] == points[-1] and len(simplified) < 4:
+                simplified = points
+            points = [(int(px), int(py)) for px, py in simplified]
+        simplified_arcs.append(points)
+
+    # 恢复导致多边形无效的弧段；恢复共享弧段可能影响相邻区域，因此反复检查直到稳定
+    polygons = [
+        polygon
+        for collection in topology.get('objects', {}).values()
+        for geometry in collection.get('geometries', [])
+        for polygon in geometry['arcs']
+    ]
+    changed = True
+    while changed:
+        changed = False
+        for polygon in polygons:
+            indices = {ref if ref >= 0 else ~ref for refs in polygon for ref in refs}
+            if all(simplified_arcs[i] is original_arcs[i] for i in indices):
+                continue
+            if not _polygon_is_valid(polygon, simplified_arcs):
+                for i in indices:
+                    simplified_arcs[i] = original_arcs[i]
+                changed = True
+
+    return {**topology, 'arcs': [_delta_encode(arc) for arc in simplified_arcs]}
+
+
+def save_topology(topology: Dict, path: str):
+    """
+    将拓扑数据写入文件（紧凑 JSON 格式）
+
+    Args:
+        topology: 拓扑字典
+        path: 输出文件路径
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(topology, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_topology(path: str) -> Dict:
+    """
+    从文件读取拓扑数据
+
+    Args:
+        path: 拓扑文件路径
+
+    Returns:
+        拓扑字典
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)